@@ -1,25 +1,21 @@
 """The entrypoint for HomeControl"""
 
 import argparse
-import asyncio
 import logging
 import logging.config
 import os
-import shutil
-import subprocess
+import select
+import signal
 import sys
+import time
 from contextlib import suppress
-from typing import List, Optional
-
-import aiomonitor
-import pkg_resources
-import yaml
+from typing import List, Optional, Set
 
 from homecontrol.const import EXIT_RESTART, MINIMUM_PYTHON_VERSION
-from homecontrol.core import Core
-from homecontrol.dependencies.yaml_loader import YAMLLoader
 
 CONFIG_FILE_NAME = "configuration.yaml"
+PID_KILL_TIMEOUT = 5
+DAEMON_ARGS = frozenset(("-d", "--daemon"))
 
 LOGGER = logging.getLogger(__name__)
 
@@ -71,8 +67,8 @@ def parse_args() -> argparse.Namespace:
             "--freeport",
             action="store_true",
             default=None,
-            help=("Frees the port for the API server using fuser. "
-                  "Therefore only available on Linux"))
+            help=("Frees the port for the API server by killing "
+                  "the processes using it. Only available on Linux"))
 
     return parser.parse_args()
 
@@ -82,6 +78,8 @@ def copy_folder(src: str, dest: str, merge_folders: bool = False) -> None:
     Copies a folder to another path overwriting files
     and merging folders
     """
+    import shutil  # pylint: disable=import-outside-toplevel
+
     for src_root, dirs, files in os.walk(src, followlinks=True):
         dest_root = src_root.replace(src, dest, 1)
         if not os.path.isdir(dest_root):
@@ -101,12 +99,35 @@ def copy_folder(src: str, dest: str, merge_folders: bool = False) -> None:
                 os.path.join(dest_root, file))
 
 
-def get_config(directory: str) -> dict:
+def install_default_config(directory: str) -> None:
+    """Copies the default configuration shipped with HomeControl"""
+    # pylint: disable=import-outside-toplevel
+    from homecontrol import __name__ as package_name
+    try:
+        from importlib.resources import as_file, files
+    except ImportError:
+        # Python 3.8 does not have importlib.resources.files
+        import pkg_resources
+        copy_folder(
+            pkg_resources.resource_filename(package_name, "default_config"),
+            directory)
+        return
+
+    with as_file(files(package_name) / "default_config") as source:
+        copy_folder(str(source), directory)
+
+
+def get_config(directory: str, use_cache: bool = True) -> dict:
     """
     Loads the config from path
     If the config file does not exist it will ask the user
     if it should initialise with default configuration
+    The parsed configuration is cached unless use_cache is False
     """
+    # pylint: disable=import-outside-toplevel
+    import yaml
+    from homecontrol.dependencies.yaml_loader import YAMLLoader
+
     file = os.path.join(directory, CONFIG_FILE_NAME)
     if not os.path.isfile(file):
         LOGGER.warning("Config file does not exist: %s", file)
@@ -125,28 +146,65 @@ def get_config(directory: str) -> dict:
             LOGGER.info(
                 "Installing the default configuration to %s",
                 directory)
-            # pylint: disable=import-outside-toplevel
-            from homecontrol import __name__ as package_name
-            source = pkg_resources.resource_filename(
-                package_name, "default_config")
-            copy_folder(source, directory)
+            install_default_config(directory)
             LOGGER.info("Running HomeControl with default config")
-            return get_config(directory)
+            return get_config(directory, use_cache=use_cache)
 
         LOGGER.critical("Terminating")
         sys.exit(1)
     try:
-        cfg: dict = YAMLLoader.load(open(file), cfg_folder=directory)
+        cfg: dict = YAMLLoader.load_file(
+            file, cfg_folder=directory, use_cache=use_cache)[0]
     except yaml.YAMLError:
         LOGGER.error("Error in config file", exc_info=True)
         sys.exit(1)
     return cfg
 
 
+def tcp_socket_inodes(port: int) -> Set[str]:
+    """Returns the inodes of the TCP sockets bound to a local port"""
+    inodes = set()
+    local_port = f":{port:04X}"
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as file:
+                next(file)  # Skip the header
+                for line in file:
+                    fields = line.split()
+                    # Sockets in TIME_WAIT have no inode
+                    if fields[1].endswith(local_port) and fields[9] != "0":
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+    return inodes
+
+
 def clear_port(port: int) -> None:
-    """Clears a TCP port, only works on posix as it depends on fuser"""
-    if os.name == "posix":
-        subprocess.call(["/bin/fuser", "-k", "{port}/tcp".format(port=port)])
+    """
+    Clears a TCP port by killing the processes using it
+    Only works on Linux as it depends on /proc
+    """
+    if os.name != "posix" or not os.path.isdir("/proc/net"):
+        return
+
+    sockets = {f"socket:[{inode}]" for inode in tcp_socket_inodes(port)}
+    if not sockets:
+        return
+
+    own_pid = os.getpid()
+    for process in os.scandir("/proc"):
+        if not process.name.isdigit() or int(process.name) == own_pid:
+            continue
+        try:
+            for file_descriptor in os.scandir(f"{process.path}/fd"):
+                if os.readlink(file_descriptor.path) in sockets:
+                    LOGGER.info("Killing process %s using port %s",
+                                process.name, port)
+                    os.kill(int(process.name), signal.SIGKILL)
+                    break
+        except OSError:
+            # The process exited or belongs to another user
+            continue
 
 
 def validate_python_version() -> None:
@@ -163,14 +221,15 @@ def run_homecontrol(
     """
     Runs HomeControl
     """
-    loop = asyncio.get_event_loop()
-    if os.name == "nt":
-        def windows_wakeup() -> None:
-            # This seems to be a workaround so that
-            # SIGINT signals also work on Windows
-            loop.call_later(0.1, windows_wakeup)
-        # https://stackoverflow.com/questions/24774980/why-cant-i-catch-sigint-when-asyncio-event-loop-is-running/24775107#answer-24775107
-        windows_wakeup()
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+    import aiomonitor
+    from homecontrol.core import Core
+
+    # The loop comes from the policy installed by set_loop_policy.
+    # The ProactorEventLoop wakes up on signals by itself since Python 3.8
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     core = Core(cfg=config,
                 cfg_file=config_file,
                 loop=loop,
@@ -178,7 +237,8 @@ def run_homecontrol(
 
     with aiomonitor.Monitor(loop=loop, locals={"core": core, "loop": loop}):
         loop.call_soon(lambda: loop.create_task(core.bootstrap()))
-        exit_return = loop.run_until_complete(core.block_until_stop())
+        loop.run_forever()
+        exit_return = core.exit_code
 
     loop.close()
 
@@ -197,38 +257,48 @@ def start_command() -> List[str]:
     Returns a command to re-execute HomeControlwith the same parameters
     except the daemon parameter
     """
-    # pylint: disable=line-too-long
-    if (os.path.basename(sys.argv[0]) == "__main__.py"
-            or (os.path.split(sys.argv[0])[-1] == "homecontrol"
-                and os.path.isdir(sys.argv[0]))):
+    argv0 = sys.argv[0]
+    base = os.path.basename(argv0)
+    args = [arg for arg in sys.argv if arg not in DAEMON_ARGS]
+
+    if (base == "__main__.py"
+            or (base == "homecontrol" and os.path.isdir(argv0))):
 
-        os.environ["PYTHONPATH"] = os.path.dirname(
-            os.path.dirname(sys.argv[0]))
+        os.environ["PYTHONPATH"] = os.path.dirname(os.path.dirname(argv0))
 
-        return ([sys.executable]
-                + [arg for arg in sys.argv if arg not in ("-d", "-daemon")])
+        return [sys.executable] + args
 
-    return [arg for arg in sys.argv if arg not in ("-d", "-daemon")]
+    return args
 
 
 def daemonize() -> None:
-    """Move current process to a daemon process."""
-    # Create first fork
-    pid = os.fork()
-    if pid > 0:
+    """
+    Moves HomeControl to a daemon process
+
+    Instead of forking the already initialised interpreter a fresh one
+    is spawned in a new session without the daemon parameter.
+    """
+    args = start_command()
+    if hasattr(os, "posix_spawn"):
+        pid = os.posix_spawn(
+            args[0], args, os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull,
+                 os.O_WRONLY | os.O_APPEND, 0),
+                (os.POSIX_SPAWN_DUP2, 1, 2)
+            ],
+            setsid=True)
+        LOGGER.info("Process ID: %s", pid)
         sys.exit(0)
 
+    if os.fork() > 0:
+        sys.exit(0)
     os.setsid()
-    LOGGER.info("Process ID: %s", os.getpid())
-
-    # redirect standard file descriptors to devnull
-    infd = open(os.devnull, 'r')
-    outfd = open(os.devnull, 'a+')
-    sys.stdout.flush()
-    sys.stderr.flush()
-    os.dup2(infd.fileno(), sys.stdin.fileno())
-    os.dup2(outfd.fileno(), sys.stdout.fileno())
-    os.dup2(outfd.fileno(), sys.stderr.fileno())
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for stream in (sys.stdin, sys.stdout, sys.stderr):
+        os.dup2(devnull, stream.fileno())
+    os.execv(args[0], args)
 
 
 def check_pid_file(pid_file: str, kill: bool = False) -> None:
@@ -248,12 +318,13 @@ def check_pid_file(pid_file: str, kill: bool = False) -> None:
     if kill:
         try:
             os.kill(pid, 9)
-            LOGGER.info("Killing previous instance of HomeControl")
-            while True:
-                os.kill(pid, 0)
         except OSError:
             # Process dead
             return
+        LOGGER.info("Killing previous instance of HomeControl")
+        if wait_for_exit(pid):
+            # An exited but not yet reaped process still answers signal 0
+            return
     try:
         os.kill(pid, 0)
     except OSError:
@@ -264,6 +335,42 @@ def check_pid_file(pid_file: str, kill: bool = False) -> None:
     sys.exit(1)
 
 
+def wait_for_exit(pid: int, timeout: float = PID_KILL_TIMEOUT) -> bool:
+    """
+    Blocks until a process has exited or the timeout is reached
+    Uses a pidfd on Linux 5.3+ and polls the process elsewhere
+    Returns whether the process has exited
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # The kernel does not support pidfds
+            pidfd = None
+
+        if pidfd is not None:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                exited = bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(pidfd)
+            return exited
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            break
+        time.sleep(0.01)
+    return False
+
+
 def setup_logging(verbose: bool = False,
                   color: bool = True,
                   logfile: Optional[str] = None
@@ -271,48 +378,59 @@ def setup_logging(verbose: bool = False,
     """
     Set up logging
     """
-    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO)
-
     fmt = "%(asctime)s %(levelname)s (%(threadName)s)[%(name)s] %(message)s"
     console_datefmt = '%H:%M:%S'
     datefmt = '%Y-%m-%d %H:%M:%S'
 
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(
+        logging.Formatter(fmt, datefmt=console_datefmt))
+
     if color:
-        # pylint: disable=import-outside-toplevel
-        from colorlog import ColoredFormatter
-
-        logging.basicConfig(level=logging.INFO)
-
-        colorfmt = "%(log_color)s{}%(reset)s".format(fmt)
-        logging.getLogger().handlers[0].setFormatter(ColoredFormatter(
-            colorfmt,
-            datefmt=console_datefmt,
-            reset=True,
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'white',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red',
-            }
-        ))
+        with suppress(ImportError):
+            # pylint: disable=import-outside-toplevel
+            from colorlog import ColoredFormatter
+
+            colorfmt = "%(log_color)s{}%(reset)s".format(fmt)
+            console_handler.setFormatter(ColoredFormatter(
+                colorfmt,
+                datefmt=console_datefmt,
+                reset=True,
+                log_colors={
+                    'DEBUG': 'cyan',
+                    'INFO': 'white',
+                    'WARNING': 'yellow',
+                    'ERROR': 'red',
+                    'CRITICAL': 'red',
+                }
+            ))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root_logger.addHandler(console_handler)
 
     if logfile:
         file_handler = logging.FileHandler(logfile, mode="w")
         file_handler.setLevel(logging.INFO if verbose else logging.WARNING)
         file_handler.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
-        logging.getLogger().addHandler(file_handler)
+        root_logger.addHandler(file_handler)
 
 
 def set_loop_policy() -> None:
     """
-    Try to use a ProactorEventLoop on Windows and uvloop elsewhere
+    Try to use winloop or a ProactorEventLoop on Windows
+    and uvloop elsewhere
     """
+    import asyncio  # pylint: disable=import-outside-toplevel
 
-    if (sys.platform == "win32"
-            and hasattr(asyncio, "WindowsProactorEventLoopPolicy")):
-        asyncio.set_event_loop_policy(
-            asyncio.WindowsProactorEventLoopPolicy())
+    if sys.platform == "win32":
+        try:
+            # pylint: disable=import-outside-toplevel
+            import winloop
+            asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+        except ImportError:
+            asyncio.set_event_loop_policy(
+                asyncio.WindowsProactorEventLoopPolicy())
 
     else:
         with suppress(ImportError):
@@ -329,7 +447,7 @@ def main() -> None:
     args = parse_args()
     logfile = args.logfile or os.path.join(args.cfgdir, "homecontrol.log")
 
-    cfg = get_config(args.cfgdir)
+    cfg = get_config(args.cfgdir, use_cache=not args.verbose)
     cfg_file = os.path.join(args.cfgdir, CONFIG_FILE_NAME)
 
     setup_logging(verbose=args.verbose,
@@ -84,7 +84,8 @@ class PasswordCredentialProvider(CredentialProvider):
         hashed = base64.b64encode(
             hashlib.sha256(data.encode()).digest())
         salted = base64.b64encode(
-            bcrypt.hashpw(hashed, bcrypt.gensalt(12))).decode()
+            await self.auth_manager.loop.run_in_executor(
+                None, bcrypt.hashpw, hashed, bcrypt.gensalt(12))).decode()
 
         creds = Credentials(
             user=user,
@@ -95,18 +96,23 @@ class PasswordCredentialProvider(CredentialProvider):
 
         return creds, None
 
-    async def validate_login_data(self, user: User, data: dict) -> bool:
-        """Validates the password against the user input"""
+    async def validate_login_data(
+            self, user: Optional[User], data: str) -> bool:
+        """
+        Validates the password against the user input
+        Unknown users are checked against a dummy hash so that
+        they can't be told apart by the response time
+        """
         hashed = base64.b64encode(
             hashlib.sha256(data.encode()).digest())
 
-        creds = self.get_primary_credentials(user)
+        creds = self.get_primary_credentials(user) if user else None
+        salted = base64.b64decode(creds.data) if creds else DUMMY_HASH
 
-        if creds:
-            return bcrypt.checkpw(hashed, base64.b64decode(creds.data))
-        else:
-            bcrypt.checkpw(hashed, DUMMY_HASH)
-            return False
+        # bcrypt is slow by design, keep it off the event loop
+        valid = await self.auth_manager.loop.run_in_executor(
+            None, bcrypt.checkpw, hashed, salted)
+        return valid and creds is not None
 
 
 class TOTPCredentialProvider(CredentialProvider):
@@ -2,9 +2,8 @@
 
 import uuid
 from functools import partial
-from typing import Callable, Optional, cast
-
-import bcrypt
+from types import MethodType
+from typing import Callable, Dict, Optional, cast
 
 import voluptuous as vol
 
@@ -66,6 +65,15 @@ class LoginFlow:
     id: str
     current_step: str = "init"
     user: Optional[User]
+    # The step methods by step_id, collected once per class
+    steps: Dict[str, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.steps = {
+            name[len("step_"):]: getattr(cls, name)
+            for name in dir(cls) if name.startswith("step_")
+        }
 
     def __init__(
             self,
@@ -82,7 +90,8 @@ class LoginFlow:
 
     def get_step(self, step_id: str) -> Optional[Callable]:
         """Returns the coroutine corresponding to a step_id"""
-        return getattr(self, f"step_{step_id}", None)
+        step = self.steps.get(step_id)
+        return MethodType(step, self) if step else None
 
     async def step_init(self, data: dict) -> FlowStep:
         """The first step of the login flow"""
@@ -158,9 +167,6 @@ class FlowManager:
         return create_flow
 
 
-DUMMY_HASH = b'$2b$12$aZFoxzj4axZgsa1oyGYQmecFwGYFzX/YvObOTCNE6Za9r9ixdUm/y'
-
-
 class PasswordLoginFlow(LoginFlow):
     """The password login flow"""
     user: Optional[User]
@@ -199,12 +205,8 @@ class PasswordLoginFlow(LoginFlow):
 
         self.user = self.auth_manager.get_user_by_name(data["username"])
 
-        if not self.user:
-            bcrypt.checkpw(data["password"].encode(), DUMMY_HASH)
-            valid_password = False
-        else:
-            valid_password = await self.password_provider.validate_login_data(
-                self.user, data=data["password"])
+        valid_password = await self.password_provider.validate_login_data(
+            self.user, data=data["password"])
 
         if not valid_password:
             return FlowStep(self, error="Invalid credentials")
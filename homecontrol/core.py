@@ -6,7 +6,7 @@ import logging
 import os
 import signal
 from contextlib import suppress
-from typing import Optional
+from typing import Awaitable, Optional, Set
 
 from homecontrol.const import (EVENT_CORE_BOOTSTRAP_COMPLETE, EXIT_RESTART,
                                EXIT_SHUTDOWN)
@@ -14,6 +14,7 @@ from homecontrol.dependencies.config_manager import ConfigManager
 from homecontrol.dependencies.event_bus import EventBus
 from homecontrol.dependencies.item_manager import ItemManager
 from homecontrol.dependencies.module_manager import ModuleManager
+from homecontrol.dependencies.state_proxy import StatePoller
 from homecontrol.dependencies.uuid import get_uuid
 
 LOGGER = logging.getLogger(__name__)
@@ -39,72 +40,93 @@ class Core:
         """
         self.start_args = start_args or argparse.Namespace()
         self.loop = loop or asyncio.get_event_loop()
-        self.cfg = ConfigManager(cfg, cfg_file)
+        self.cfg = ConfigManager(
+            cfg, cfg_file,
+            use_cache=not getattr(self.start_args, "verbose", False))
         self.cfg_path = cfg_file
         self.cfg_dir = os.path.dirname(cfg_file)
-        self.block_future = asyncio.Future()
+        self.exit_code: Optional[str] = None
+        self._tasks: Set[asyncio.Task] = set()
         self.event_bus = EventBus(core=self)
         self.module_manager = ModuleManager(core=self)
         self.modules = self.module_manager.module_accessor
         self.item_manager = ItemManager(core=self)
+        self.state_poller = StatePoller(self.loop)
         self.uuid = get_uuid(self)
+        self._add_signal_handlers()
+
+    def _add_signal_handlers(self) -> None:
+        """
+        Shuts down on SIGINT and SIGTERM
+
+        Installed before bootstrap so that no signal gets lost
+        while the modules are loading
+        """
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            if os.name != "nt":
+                self.loop.add_signal_handler(signum, self.shutdown)
+            else:
+                # Windows does not support loop.add_signal_handler
+                signal.signal(
+                    signum,
+                    lambda *_: self.loop.call_soon_threadsafe(self.shutdown))
 
     async def bootstrap(self) -> None:
         """
         Startup coroutine for Core
         """
-        if not os.name == "nt":  # Windows does not have signals
-            self.loop.add_signal_handler(signal.SIGINT, self.shutdown)
-            self.loop.add_signal_handler(signal.SIGTERM, self.shutdown)
-        else:
-            # Windows needs its special signal handling
-            signal.signal(signal.SIGINT, self.shutdown)
-            signal.signal(signal.SIGTERM, self.shutdown)
-
         # Load modules
         await self.module_manager.init()
 
         # Init items
-        self.loop.create_task(self.item_manager.init())
+        self.create_task(self.item_manager.init())
 
         self.event_bus.broadcast(EVENT_CORE_BOOTSTRAP_COMPLETE)
         LOGGER.info("Core bootstrap complete")
 
-    async def block_until_stop(self) -> int:
+    def create_task(self, coro: Awaitable) -> asyncio.Task:
         """
-        Blocking method to keep HomeControl running
-        until Core.block_future is done
-
-        Also triggers the stop coroutine when block_future has a result
+        Creates a task that Core.stop waits for before closing the loop
         """
-        with suppress(asyncio.CancelledError):
-            exit_return = await self.block_future
-
-        await self.stop()
-        return exit_return
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
 
     async def stop(self) -> None:
-        """Stops HomeControl"""
+        """Stops HomeControl and the event loop"""
         LOGGER.warning("Shutting Down")
-        await self.item_manager.stop()
-        await self.module_manager.stop()
-
-        pending = [task
-                   for task
-                   in asyncio.all_tasks(loop=self.loop)
-                   if task is not asyncio.current_task(loop=self.loop)]
-
-        if pending:
-            LOGGER.info("Waiting for pending tasks (1s)")
-            await asyncio.wait(pending, loop=self.loop, timeout=1)
-
-        LOGGER.warning("Closing the loop soon")
-        self.loop.call_soon(self.loop.stop)
+        try:
+            self.state_poller.stop()
+            await self.item_manager.stop()
+            await self.module_manager.stop()
+
+            pending = list(self._tasks)
+
+            if pending:
+                LOGGER.info("Waiting for pending tasks (1s)")
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        asyncio.gather(*pending, return_exceptions=True),
+                        timeout=1)
+        # pylint: disable=broad-except
+        except Exception:
+            LOGGER.exception("Error while shutting down")
+        finally:
+            LOGGER.warning("Closing the loop soon")
+            self.loop.call_soon(self.loop.stop)
+
+    def _stop_with(self, exit_code: str) -> None:
+        """Schedules stop with an exit code unless already stopping"""
+        if self.exit_code:
+            return
+        self.exit_code = exit_code
+        self.loop.create_task(self.stop())
 
     def restart(self) -> None:
         """Restarts HomeControl"""
-        self.block_future.set_result(EXIT_RESTART)
+        self._stop_with(EXIT_RESTART)
 
     def shutdown(self) -> None:
         """Shuts HomeControl down"""
-        self.block_future.set_result(EXIT_SHUTDOWN)
+        self._stop_with(EXIT_SHUTDOWN)
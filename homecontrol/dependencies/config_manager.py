@@ -2,11 +2,11 @@
 
 import logging
 import os
-from collections import defaultdict
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Union
 
 import voluptuous as vol
-from homecontrol.dependencies.yaml_loader import YAMLLoader
+from homecontrol.dependencies.yaml_loader import (YAMLLoader,
+                                                  dependencies_changed)
 from homecontrol.exceptions import (ConfigDomainAlreadyRegistered)
 
 LOGGER = logging.getLogger(__name__)
@@ -19,9 +19,12 @@ class ConfigManager:
     Manages the configuration with configuration domains
     """
 
-    def __init__(self, cfg: dict, cfg_path: str) -> None:
+    def __init__(self, cfg: dict, cfg_path: str,
+                 use_cache: bool = False) -> None:
         self.cfg = cfg
         self.cfg_path = cfg_path
+        self.use_cache = use_cache
+        self._dependencies: Optional[Dict[str, Optional[int]]] = None
         self.domains = {}
         self.domain_schemas = {}
 
@@ -34,8 +37,14 @@ class ConfigManager:
 
     async def reload_config(self, only_domain: Optional[str] = None) -> None:
         """Reloads the configuration and updates where it can"""
-        cfg = YAMLLoader.load(
-            open(self.cfg_path), cfg_folder=os.path.dirname(self.cfg_path))
+        if (self._dependencies is not None
+                and not dependencies_changed(self._dependencies)):
+            LOGGER.debug("Config unchanged, skipping reload")
+            return
+
+        cfg, dependencies = YAMLLoader.load_file(
+            self.cfg_path, cfg_folder=os.path.dirname(self.cfg_path),
+            use_cache=self.use_cache)
 
         LOGGER.info("Reloading the configuration")
         for domain, raw_domain_config in cfg.items():
@@ -64,6 +73,8 @@ class ConfigManager:
 
                 LOGGER.info("Configuration for domain %s updated", domain)
 
+        if not only_domain:
+            self._dependencies = dependencies
         LOGGER.info("Completed updating the configuration")
 
     def validate_domain_config(self,
@@ -87,10 +98,14 @@ class ConfigManager:
     async def register_domain(self,
                               domain: str,
                               handler: Optional[object] = None,
-                              schema: Optional[vol.Schema] = None,
+                              schema: Optional[
+                                  Union[vol.Schema, dict, list]] = None,
                               default: Optional[Any] = None) -> Any:
         """
         Registers a configuration domain
+
+        Plain dict or list schemas are compiled once
+        so that reloads can reuse the compiled validator
         """
         default = {} if default is None else default
         if domain in self.domains:
@@ -99,6 +114,8 @@ class ConfigManager:
 
         self.domains[domain] = handler
         if schema:
+            if not isinstance(schema, vol.Schema):
+                schema = vol.Schema(schema)
             self.domain_schemas[domain] = schema
 
         return self.validate_domain_config(
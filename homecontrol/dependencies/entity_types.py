@@ -4,6 +4,7 @@ Every new Item or Module will get one of these classes as a base class
 """
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 
 import voluptuous as vol
@@ -33,6 +34,8 @@ class Item:
     module: Optional["Module"]
     states: StateProxy
     actions: Dict[str, Callable]
+    # Maps action names to method names, collected once per class
+    action_methods: Dict[str, str] = {}
 
     @classmethod
     async def constructor(
@@ -52,11 +55,7 @@ class Item:
         item.states = StateProxy(
             item, core, state_defaults=state_defaults or {})
 
-        item.actions = {}
-        for attribute in dir(item):
-            func = getattr(item, attribute)
-            if hasattr(func, "action_name"):
-                item.actions[getattr(func, "action_name")] = func
+        item.bind_actions()
 
         return item
 
@@ -64,6 +63,13 @@ class Item:
         return (f"<Item {self.type} identifier={self.identifier} "
                 f"name={self.name}>")
 
+    def bind_actions(self) -> None:
+        """Binds the methods marked as actions to this item"""
+        self.actions = {
+            action_name: getattr(self, name)
+            for action_name, name in self.action_methods.items()
+        }
+
     async def init(self) -> None:
         """Default init method"""
         return
@@ -84,18 +90,22 @@ class Item:
     async def run_action(
             self, name: str, kwargs: Dict[str, Any]) -> Any:
         """Runs an action"""
-        if name in self.actions:
-            return await self.actions[name](**kwargs)
+        action = self.actions.get(name)
+        if action:
+            return await action(**kwargs)
         raise ActionNotExists(
             f"Item of type {self.type} does not have action {name}")
 
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
+        cls.action_methods = {}
         for name in dir(cls):
-            state_def: StateDef = getattr(cls, name)
-            if not isinstance(state_def, StateDef):
+            attribute = getattr(cls, name)
+            if hasattr(attribute, "action_name"):
+                cls.action_methods[attribute.action_name] = name
+            if not isinstance(attribute, StateDef):
                 continue
-            setattr(cls, name, state_def.inherit(cls))
+            setattr(cls, name, attribute.inherit(cls))
 
         super().__init_subclass__(**kwargs)
 
@@ -109,6 +119,22 @@ class Item:
             if getattr(item_type, "type", None)
         ]
 
+    @cached_property
+    def static_info(self) -> Dict[str, Any]:
+        """
+        Returns the information about the item
+        that doesn't change once it is set up
+        """
+        return {
+            "identifier": self.identifier,
+            "unique_identifier": self.unique_identifier,
+            "name": self.name,
+            "type": self.type,
+            "module": self.module.name,
+            "actions": list(self.actions.keys()),
+            "implements": self.implements
+        }
+
     @property
     def metadata(self) -> Dict[str, Any]:
         """Returns additional metadata about the item"""
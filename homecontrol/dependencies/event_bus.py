@@ -2,9 +2,8 @@
 
 import asyncio
 import logging
-from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +33,8 @@ class EventBus:
 
     def __init__(self, core) -> None:
         self.core = core
-        self.handlers = defaultdict(set)
+        self.handlers: Dict[str, Set[Callable]] = {}
+        self._handler_cache: Dict[str, Tuple[Callable, ...]] = {}
 
     @staticmethod
     def create_event(event_type: str,
@@ -47,14 +47,26 @@ class EventBus:
         data.update(kwargs)
         return Event(event_type, data=data, timestamp=datetime.utcnow())
 
-    def get_event_handlers(self, event: Event) -> List:
+    def get_event_handlers(self, event: Event) -> Tuple[Callable, ...]:
         """
-        Returns a list of handlers for an Event
+        Returns the handlers for an Event
+
+        The result is cached per event type until a handler
+        for that event type is registered or removed
         """
-        return (
-            list(self.handlers.get("*", list()))
-            + list(self.handlers.get(event.event_type, list()))
-        )
+        handlers = self._handler_cache.get(event.event_type)
+        if handlers is None:
+            handlers = self._handler_cache[event.event_type] = (
+                *self.handlers.get("*", ()),
+                *self.handlers.get(event.event_type, ()))
+        return handlers
+
+    def _invalidate_handler_cache(self, event: str) -> None:
+        """Clears the cached handlers affected by a change to event"""
+        if event == "*":
+            self._handler_cache.clear()
+        else:
+            self._handler_cache.pop(event, None)
 
     def broadcast(self,  # lgtm [py/similar-function]
                   event_type: str,
@@ -74,9 +86,8 @@ class EventBus:
 
         LOGGER.debug("Event: %s", event)
 
-        return [asyncio.ensure_future(
-            handler(event, **kwargs),
-            loop=self.core.loop) for handler in self.get_event_handlers(event)]
+        return [self.core.create_task(handler(event, **kwargs))
+                for handler in self.get_event_handlers(event)]
 
     async def gather(self,
                      event_type: str,
@@ -89,17 +100,24 @@ class EventBus:
         tasks = self.broadcast(event_type, data, **kwargs)
         if not tasks:
             return []
-        return await asyncio.gather(*tasks, loop=self.core.loop)
+        return await asyncio.gather(*tasks)
 
     def register(self, event: str) -> Callable:
         """
         Decorator to register event handlers
         """
         def _register(coro):
-            self.handlers[event].add(coro)
+            self.handlers.setdefault(event, set()).add(coro)
+            self._invalidate_handler_cache(event)
             return coro
         return _register
 
     def remove_handler(self, event: str, handler: Callable) -> None:
         """Removes an event handler"""
-        self.handlers[event].discard(handler)
+        handlers = self.handlers.get(event)
+        if handlers is None:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self.handlers[event]
+        self._invalidate_handler_cache(event)
@@ -98,7 +98,7 @@ class ItemManager:
         self.yaml_cfg = cast(List[dict], await self.core.cfg.register_domain(
             "items", schema=CONFIG_SCHEMA, default=[]))
         self.load_yaml_config()
-        self.core.loop.create_task(self.init_from_storage())
+        self.core.create_task(self.init_from_storage())
 
     async def init_from_storage(self) -> None:
         """Initializes the items configured in the storage"""
@@ -206,6 +206,7 @@ class ItemManager:
                 identifier)
             return
 
+        self.core.state_poller.remove(item.states.states.values())
         await self.stop_item(item)
 
         self.core.event_bus.broadcast(EVENT_ITEM_REMOVED, item=item)
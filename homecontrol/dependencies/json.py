@@ -2,14 +2,53 @@
 
 # pylint: disable=invalid-name,too-few-public-methods,import-self
 import json
+from contextlib import suppress
 from datetime import datetime
 from enum import Enum
 from functools import partial
-from typing import TYPE_CHECKING, Type, cast
+from operator import attrgetter, methodcaller
+from typing import TYPE_CHECKING, Any, Callable, Dict, Type, Union, cast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from homecontrol.core import Core
 
+JSONDecodeError = json.JSONDecodeError
+
+
+def _identity(o):
+    return o
+
+
+def _find_encoder(cls: type) -> Callable[[Any], Any]:
+    """Returns the encoder for instances of a type"""
+    if issubclass(cls, Enum):
+        return attrgetter("value")
+
+    if issubclass(cls, datetime):
+        return methodcaller("isoformat")
+
+    if hasattr(cls, "dump"):
+        return methodcaller("dump")
+
+    return _identity
+
+
+# Encoders are looked up once per type
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def encode_custom_type(o):
+    """Encode custom types"""
+    encoder = _ENCODERS.get(type(o))
+    if encoder is None:
+        encoder = _ENCODERS[type(o)] = _find_encoder(type(o))
+    return encoder(o)
+
 
 class JSONEncoder(json.JSONEncoder):
     """Custom JSONEncoder that also parses HomeControl types"""
@@ -18,19 +57,10 @@ class JSONEncoder(json.JSONEncoder):
         self.core = core
         super().__init__(*args, **kwargs)
 
-    # pylint: disable=no-self-use,too-many-return-statements,method-hidden
+    # pylint: disable=no-self-use,method-hidden
     def default(self, o):
         """Encode custom types"""
-        if isinstance(o, Enum):
-            return o.value
-
-        if isinstance(o, datetime):
-            return o.isoformat()
-
-        if hasattr(o, "dump"):
-            return o.dump()
-
-        return o
+        return encode_custom_type(o)
 
 
 def dumps(obj, *, indent=None, sort_keys=False, core: "Core" = None, **kw):
@@ -43,6 +73,40 @@ def dumps(obj, *, indent=None, sort_keys=False, core: "Core" = None, **kw):
         indent=indent, sort_keys=sort_keys, **kw)
 
 
+def dumps_bytes(obj, *, indent: bool = False, sort_keys: bool = False,
+                core: "Core" = None) -> bytes:
+    """
+    Dumps an object into UTF-8 encoded JSON with support
+    for HomeControl's data types
+
+    Uses orjson if it is installed, indent then means two spaces
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        # orjson is stricter, e.g. with integers above 64 bit
+        with suppress(TypeError):
+            return orjson.dumps(obj, default=encode_custom_type, option=option)
+
+    if indent:
+        return dumps(obj, indent=2, sort_keys=sort_keys, core=core).encode()
+    return dumps(obj, sort_keys=sort_keys, core=core,
+                 separators=(",", ":")).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Loads JSON from a string or bytes
+    Uses orjson if it is installed
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def dump(obj, fp, *, indent=None, sort_keys=False, core: "Core" = None, **kw):
     """
     Dumps an object into a Writer with support for HomeControl's data types
@@ -17,11 +17,12 @@ class JSONResponse(web.Response):
             error: Optional[Union[Exception, str]] = None,
             status_code: int = 200,
             core=None,
-            headers: dict = None) -> None:
+            headers: dict = None,
+            pretty: bool = False) -> None:
 
         response = {"error": error} if error else data
 
-        super().__init__(body=json.dumps(response, indent=4, sort_keys=True,
-                                         core=core),
+        super().__init__(body=json.dumps_bytes(response, indent=pretty,
+                                               sort_keys=pretty, core=core),
                          status=status_code, content_type="application/json",
                          charset="utf-8", headers=headers)
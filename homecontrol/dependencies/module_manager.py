@@ -106,7 +106,7 @@ class ModuleLoader:
 
     def _folder_spec(self):
         spec_path = os.path.join(self.mod_path, "module.yaml")
-        spec = (YAMLLoader.load(open(spec_path))
+        spec = (YAMLLoader.load_file(spec_path)[0]
                 if os.path.isfile(spec_path) else {})
 
         return spec, None
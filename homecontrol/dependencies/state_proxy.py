@@ -1,8 +1,12 @@
 """StateProxy module"""
 import asyncio
+import heapq
+import itertools
 import logging
+from contextlib import suppress
 from types import MethodType
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union, cast
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
+                    Optional, Set, Tuple, Union, cast)
 
 import voluptuous as vol
 
@@ -87,6 +91,83 @@ class StateDef:
         return state_def
 
 
+class StatePoller:
+    """
+    Polls all states that have a poll_interval from a single task
+
+    The states are kept in a heap ordered by their next deadline
+    so that the loop only wakes up once for the earliest one
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._heap: List[Tuple[float, int, "State"]] = []
+        self._counter = itertools.count()
+        self._states: Set["State"] = set()
+        self._polls: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, state: "State") -> None:
+        """Starts polling a state"""
+        self._states.add(state)
+        self._schedule(state, self.loop.time())
+
+    def remove(self, states: Iterable["State"]) -> None:
+        """Stops polling states, e.g. those of a removed item"""
+        self._states.difference_update(states)
+        self._heap = [
+            entry for entry in self._heap if entry[2] in self._states]
+        heapq.heapify(self._heap)
+
+    def stop(self) -> None:
+        """Cancels the poller and the running polls"""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in self._polls:
+            task.cancel()
+        self._states.clear()
+        self._heap.clear()
+
+    def _schedule(self, state: "State", deadline: float) -> None:
+        """Schedules a state to be polled at a loop time"""
+        heapq.heappush(self._heap, (deadline, next(self._counter), state))
+        if not self._task:
+            self._task = self.loop.create_task(self._run())
+        elif self._wakeup:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Waits for the earliest deadline and polls the expired states"""
+        self._wakeup = asyncio.Event()
+        while self._heap:
+            delay = self._heap[0][0] - self.loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                continue
+            state = heapq.heappop(self._heap)[2]
+            task = self.loop.create_task(self._poll(state))
+            self._polls.add(task)
+            task.add_done_callback(self._polls.discard)
+        self._task = None
+
+    async def _poll(self, state: "State") -> None:
+        """Polls a state and re-arms it"""
+        try:
+            await state.poll_value()
+        # pylint: disable=broad-except
+        except Exception:
+            LOGGER.exception("Polling state %s of %s failed",
+                             state.name,
+                             state.state_proxy.item.unique_identifier)
+        if state in self._states:
+            self._schedule(
+                state, self.loop.time() + cast(float, state.poll_interval))
+
+
 class StateProxy:
     """Holds the states of an item"""
 
@@ -120,6 +201,32 @@ class StateProxy:
         """Sets an item's state"""
         return await self.states[state].set(value)
 
+    async def bulk_set(self, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sets multiple states of an item concurrently
+        Broadcasts a single state_change event for all of them
+        The changes of the successful setters are broadcast
+        before the first error is raised
+        """
+        result: Dict[str, Any] = {}
+        error: Optional[BaseException] = None
+        results = await asyncio.gather(*(
+            self.states[state].set(value, broadcast=False)
+            for state, value in changes.items()), return_exceptions=True)
+        for state_changes in results:
+            if isinstance(state_changes, BaseException):
+                error = error or state_changes
+                continue
+            result.update(state_changes)
+
+        if result:
+            self.core.event_bus.broadcast(
+                "state_change", item=self.item, changes=result)
+            LOGGER.debug("State change: %s %s", self.item.identifier, result)
+        if error:
+            raise error
+        return result
+
     def check_value(self, state: str, value) -> vol.Error:
         """Checks if a value is valid for a state"""
         return self.states[state].check_value(value)
@@ -129,23 +236,27 @@ class StateProxy:
         return self.states[state].update(value)
 
     def bulk_update(self, **kwargs) -> None:
-        """Called from an item to update multiple states"""
-        updated = set()
-        for state, value in kwargs.items():
-            if state not in self.states:
+        """
+        Called from an item to update multiple states
+        Only the states that actually changed are broadcast
+        """
+        changes = {}
+        for name, value in kwargs.items():
+            state = self.states.get(name)
+            if not state:
                 LOGGER.warning("bulk_update: State %s does not exist for %s",
-                               state, self.item.unique_identifier)
+                               name, self.item.unique_identifier)
                 continue
-            if self.states[state].value == value:
+            if state.value == value:
                 continue
-            self.states[state].value = value
-            updated.add(state)
+            state.value = value
+            changes[name] = value
 
-        if not updated:
+        if not changes:
             return
         self.core.event_bus.broadcast(
-            "state_change", item=self.item, changes=kwargs)
-        LOGGER.debug("State change: %s %s", self.item.identifier, kwargs)
+            "state_change", item=self.item, changes=changes)
+        LOGGER.debug("State change: %s %s", self.item.identifier, changes)
 
     async def dump(self) -> Dict[str, Any]:
         """Return a JSON serialisable object"""
@@ -161,7 +272,6 @@ class State:
     setter: Optional[Callable]
     value: Any
     mutable: bool
-    poll_task: Optional[asyncio.Task] = None
     schema: Optional[vol.Schema]
 
     # pylint: disable=too-many-arguments
@@ -184,14 +294,12 @@ class State:
         self.poll_interval = poll_interval
         self.log_state = log_state
         if self.poll_interval:
-            self.poll_task = self.loop.create_task(self.poll_value())
+            self.state_proxy.core.state_poller.add(self)
 
     async def poll_value(self) -> None:
         """Polls the current state and updates it"""
-        while True:
-            if self.state_proxy.item.status == ItemStatus.ONLINE:
-                self.update(await self.getter())
-            await asyncio.sleep(cast(float, self.poll_interval))
+        if self.state_proxy.item.status == ItemStatus.ONLINE:
+            self.update(await self.getter())
 
     async def get(self):
         """Gets a state"""
@@ -201,8 +309,11 @@ class State:
             return await self.getter()
         return self.value
 
-    async def set(self, value) -> Dict[str, Any]:
-        """Sets a state"""
+    async def set(self, value, broadcast: bool = True) -> Dict[str, Any]:
+        """
+        Sets a state
+        broadcast can be disabled if the caller broadcasts the changes
+        """
         if self.state_proxy.item.status != ItemStatus.ONLINE:
             raise ItemNotOnlineError(self.state_proxy.item.identifier)
         if self.schema:  # Apply schema to new value
@@ -212,6 +323,8 @@ class State:
             result: dict = await self.setter(value)
             for state, change in result.items():
                 self.state_proxy.states[state].value = change
+            if not broadcast:
+                return result
             self.state_proxy.core.event_bus.broadcast(
                 "state_change", item=self.state_proxy.item, changes=result)
             LOGGER.debug("State change: %s %s",
@@ -57,6 +57,7 @@ class Storage:
         self.loader = loader
         self.dumper = dumper
         self.migrator = migrator
+        self.core = core
         self.loop = loop or core.loop
         self.cfg_dir = cfg_dir or core.cfg_dir
         self._save_task: Optional[asyncio.Future] = None
@@ -123,6 +124,8 @@ class Storage:
 
     def schedule_save(self, data: Any) -> asyncio.Task:
         """Saves the data"""
+        if self.core:
+            return self.core.create_task(self.save_data(data))
         return self.loop.create_task(self.save_data(data))
 
     async def save_data(self, data: Any) -> None:
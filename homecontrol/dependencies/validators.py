@@ -1,5 +1,5 @@
 """Config validators"""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 import voluptuous as vol
 
@@ -9,23 +9,37 @@ if TYPE_CHECKING:
 
 
 class IsItem:
-    """A validator to get an item"""
+    """
+    A validator to get an item
+
+    Resolved items are cached per identifier. A cached item is only
+    returned while it is still registered with the ItemManager.
+    """
 
     def __init__(self, core: "Core", msg: str = None) -> None:
         self.core = core
         self.msg = msg
+        self._cache: Dict[str, "Item"] = {}
 
     def __call__(self, identifier: str) -> "Item":
         if not isinstance(identifier, str):
             raise vol.Invalid(
                 f"Item identifier has to be string, not {type(identifier)}")
 
+        item = self._cache.get(identifier)
+        if (item is not None
+                and self.core.item_manager.items.get(item.identifier)
+                is item):
+            return item
+
         item = self.core.item_manager.get_item(identifier)
         if not item:
+            self._cache.pop(identifier, None)
             raise vol.Invalid(
                 self.msg.format(identifier=identifier)
                 if self.msg
                 else f"Item with identifier {identifier} does not exist")
+        self._cache[identifier] = item
         return item
 
     def __repr__(self):
@@ -1,9 +1,15 @@
 """Provides a YAML loader"""
 
+import glob
+import hashlib
+import io
 import itertools
 import logging
 import os
-from typing import Optional, Union
+import pickle
+import tempfile
+from contextlib import suppress
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 from yaml.composer import Composer
@@ -23,36 +29,39 @@ FORMAT_STRING_SCHEMA = vol.Schema({
 }, extra=vol.ALLOW_EXTRA)
 
 
+try:
+    # libyaml implements the reader, scanner, parser and composer in C
+    from yaml.cyaml import CParser as ParserBase
+except ImportError:
+    # pylint: disable=too-many-ancestors
+    class ParserBase(Reader, Scanner, Parser, Composer):  # type: ignore
+        """Pure Python fallback if PyYAML was built without libyaml"""
+
+        def __init__(self, stream):
+            Reader.__init__(self, stream)
+            Scanner.__init__(self)
+            Parser.__init__(self)
+            Composer.__init__(self)
+
+
 # pylint: disable=no-member,no-self-use
 # pylint: disable=too-many-ancestors
-class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
+class YAMLLoader(ParserBase, SafeConstructor, Resolver):
     """Loads YAML with custom constructors"""
     cfg_folder: Optional[str]
     name: str
+    dependencies: Dict[str, int]
+    cacheable: bool
 
-    def __init__(self, stream, cfg_folder: str = None):
+    def __init__(self, stream, cfg_folder: str = None, name: str = None):
         self.cfg_folder = cfg_folder
-        Reader.__init__(self, stream)
-        Scanner.__init__(self)
-        Parser.__init__(self)
-        Composer.__init__(self)
+        self.dependencies = {}
+        self.cacheable = True
+        ParserBase.__init__(self, stream)
         SafeConstructor.__init__(self)
         Resolver.__init__(self)
-
-        self.add_constructor(
-            "!format",
-            self.__class__.format_string_constructor)
-        self.add_constructor("!file", self.__class__.file_contructor)
-        self.add_constructor(
-            "!include", self.__class__.include_file_constructor)
-        self.add_constructor(
-            "!include_merge", self.__class__.include_merge_constructor)
-        self.add_constructor(
-            "!include_dir_file_mapped",
-            self.__class__.include_dir_file_mapped_constructor)
-        self.add_constructor("!env_var", self.__class__.env_var_constructor)
-        self.add_constructor("!path", self.__class__.path_constructor)
-        self.add_constructor("!listdir", self.__class__.listdir_constructor)
+        # CParser does not expose the stream name
+        self.name = name or getattr(stream, "name", "<stream>")
 
     @classmethod
     def load(cls, data, cfg_folder: str = None):
@@ -63,6 +72,80 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
         finally:
             loader.dispose()
 
+    @classmethod
+    def load_file(
+            cls, path: str, cfg_folder: str = None, use_cache: bool = False
+    ) -> Tuple[Any, Dict[str, Optional[int]]]:
+        """
+        Loads a YAML file
+
+        Returns the data and the mtimes of the file and every file
+        or folder it includes, see dependencies_changed
+
+        With use_cache the result is cached in a pickle file next to it.
+        The cache is keyed by the file's mtime and content hash and
+        is invalidated when one of the included files changes.
+        Documents using !env_var are never cached.
+        """
+        mtime_ns = _mtime_ns(path)
+        with open(path, "rb") as file:
+            content = file.read()
+
+        if not use_cache:
+            data, loader = cls._parse(content, path, cfg_folder)
+            return data, {path: mtime_ns, **loader.dependencies}
+
+        key = (f"{os.path.getmtime(path):.0f}-"
+               f"{hashlib.blake2b(content, digest_size=8).hexdigest()}")
+        cache_path = f"{path}.{key}.pkl"
+
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "rb") as file:
+                    cache = pickle.load(file)
+                if not dependencies_changed(cache["dependencies"]):
+                    return cache["data"], {
+                        path: mtime_ns, **cache["dependencies"]}
+            except (OSError, pickle.UnpicklingError, EOFError,
+                    KeyError, TypeError):
+                LOGGER.debug("Invalid config cache %s", cache_path)
+
+        data, loader = cls._parse(content, path, cfg_folder)
+        if loader.cacheable:
+            _write_cache(path, cache_path, {
+                "dependencies": loader.dependencies,
+                "data": data
+            })
+        return data, {path: mtime_ns, **loader.dependencies}
+
+    @classmethod
+    def _parse(
+            cls, content: bytes, path: str, cfg_folder: Optional[str]
+    ) -> Tuple[Any, "YAMLLoader"]:
+        """Parses the content of a file and returns the data and loader"""
+        # A named stream makes the error marks point to the file
+        stream = io.BytesIO(content)
+        stream.name = path
+        loader = cls(stream, cfg_folder=cfg_folder, name=path)
+        try:
+            return loader.get_single_data(), loader
+        finally:
+            loader.dispose()
+
+    def _load_include(self, path: str) -> Any:
+        """Loads an included file and keeps track of its dependencies"""
+        self._add_dependency(path)
+        with open(path, "rb") as file:
+            content = file.read()
+        data, loader = self._parse(content, path, self.cfg_folder)
+        self.dependencies.update(loader.dependencies)
+        self.cacheable = self.cacheable and loader.cacheable
+        return data
+
+    def _add_dependency(self, path: str) -> None:
+        """Marks a file or folder as a dependency for cached results"""
+        self.dependencies[path] = _mtime_ns(path)
+
     def _obj(
             self, cls,
             node: Union[yaml.MappingNode, yaml.SequenceNode, yaml.ScalarNode]
@@ -95,7 +178,7 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
         if not os.path.isfile(path):
             raise FileNotFoundError(path)
 
-        return self.__class__.load(open(path, "r"), cfg_folder=self.cfg_folder)
+        return self._load_include(path)
 
     def file_contructor(self, node: yaml.Node = None) -> str:
         """
@@ -106,6 +189,7 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
             raise TypeError("file path must be str")
         path = resolve_path(
             node.value, file_path=self.name, config_dir=self.cfg_folder)
+        self._add_dependency(path)
         with open(path) as file:
             return file.read()
 
@@ -124,11 +208,10 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
         if not os.path.isdir(folder):
             raise FileNotFoundError(folder)
 
+        self._add_dependency(folder)
         return {
-            os.path.splitext(file)[0]: self.__class__.load(
-                open(os.path.join(folder, file), "r"),
-                cfg_folder=self.cfg_folder
-            )
+            os.path.splitext(file)[0]: self._load_include(
+                os.path.join(folder, file))
             for file in os.listdir(folder) if file.endswith(".yaml")
         }
 
@@ -157,14 +240,12 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
             if os.path.isfile(path):
                 files.add(path)
             elif os.path.isdir(path):
+                self._add_dependency(path)
                 for file in os.listdir(path):
                     if file.endswith(".yaml"):
                         files.add(os.path.join(path, file))
 
-        loaded_files = [
-            self.__class__.load(
-                open(file, "r"),
-                cfg_folder=self.cfg_folder) for file in files]
+        loaded_files = [self._load_include(file) for file in files]
 
         if not all(isinstance(loaded_file, type(loaded_files[0]))
                    for loaded_file in loaded_files):
@@ -198,6 +279,7 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
         """
         path = resolve_path(
             node.value, file_path=self.name, config_dir=self.cfg_folder)
+        self._add_dependency(path)
 
         if os.path.isdir(path):
             return [os.path.join(path, item) for item in os.listdir(path)]
@@ -209,6 +291,8 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
         !env_var <name> [default]
         """
         args = node.value.split()
+        # Environment variables may change without the file changing
+        self.cacheable = False
 
         if len(args) > 1:
             return os.getenv(args[0], default=" ".join(args[1:]))
@@ -225,3 +309,58 @@ class YAMLLoader(Reader, Scanner, Parser, Composer, SafeConstructor, Resolver):
         mapping = FORMAT_STRING_SCHEMA(self.construct_mapping(node))
 
         return mapping["template"].format(**mapping)
+
+
+YAMLLoader.add_constructor(
+    "!format", YAMLLoader.format_string_constructor)
+YAMLLoader.add_constructor("!file", YAMLLoader.file_contructor)
+YAMLLoader.add_constructor("!include", YAMLLoader.include_file_constructor)
+YAMLLoader.add_constructor(
+    "!include_merge", YAMLLoader.include_merge_constructor)
+YAMLLoader.add_constructor(
+    "!include_dir_file_mapped",
+    YAMLLoader.include_dir_file_mapped_constructor)
+YAMLLoader.add_constructor("!env_var", YAMLLoader.env_var_constructor)
+YAMLLoader.add_constructor("!path", YAMLLoader.path_constructor)
+YAMLLoader.add_constructor("!listdir", YAMLLoader.listdir_constructor)
+
+
+def dependencies_changed(dependencies: Dict[str, Optional[int]]) -> bool:
+    """Checks if one of the files returned by load_file has changed"""
+    return any(_mtime_ns(path) != mtime_ns
+               for path, mtime_ns in dependencies.items())
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Returns the mtime of a path or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _write_cache(path: str, cache_path: str, cache: dict) -> None:
+    """Atomically writes a cache file and removes outdated ones"""
+    try:
+        file = tempfile.NamedTemporaryFile(
+            "wb", dir=os.path.dirname(os.path.abspath(path)),
+            suffix=".tmp", delete=False)
+    except OSError:
+        LOGGER.debug("Cannot create config cache %s", cache_path)
+        return
+
+    try:
+        with file:
+            pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, cache_path)
+    except (OSError, pickle.PicklingError):
+        LOGGER.debug("Could not write config cache %s", cache_path,
+                     exc_info=True)
+        with suppress(OSError):
+            os.remove(file.name)
+        return
+
+    for outdated in glob.glob(f"{glob.escape(path)}.*.pkl"):
+        if outdated != cache_path:
+            with suppress(OSError):
+                os.remove(outdated)
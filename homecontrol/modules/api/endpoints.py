@@ -1,16 +1,15 @@
 """"API endpoints"""
 
-import json
 import logging
-from collections import ChainMap
 
 from aiohttp import web
 
 import voluptuous as vol
 from homecontrol.const import (ERROR_INVALID_ITEM_STATE,
-                               ERROR_INVALID_ITEM_STATES, ERROR_ITEM_NOT_FOUND,
+                               ERROR_INVALID_ITEM_STATES,
                                ITEM_ACTION_NOT_FOUND, ITEM_STATE_NOT_FOUND,
                                ItemStatus)
+from homecontrol.dependencies import json
 from homecontrol.dependencies.json_response import JSONResponse
 from homecontrol.exceptions import ItemNotOnlineError
 from homecontrol.modules.auth.decorator import needs_auth
@@ -97,14 +96,8 @@ class ListItemsView(APIView):
         """"GET /items"""
         return self.json([
             {
-                "identifier": item.identifier,
-                "unique_identifier": item.unique_identifier,
-                "name": item.name,
-                "type": item.type,
-                "module": item.module.name,
+                **item.static_info,
                 "status": item.status.value,
-                "actions": list(item.actions.keys()),
-                "implements": item.implements,
                 "metadata": item.metadata
             } for item in self.core.item_manager.items.values()
         ])
@@ -121,9 +114,7 @@ class GetItemView(APIView):
         item = self.core.item_manager.items.get(identifier)
 
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", 404)
+            return self.item_not_found(identifier)
 
         storage_entry = self.core.item_manager.get_storage_entry(
             item.unique_identifier)
@@ -156,9 +147,7 @@ class ItemStatesView(APIView):
         item = self.core.item_manager.items.get(identifier)
 
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", 404)
+            return self.item_not_found(identifier)
 
         return self.json({
             "item": item.identifier,
@@ -172,17 +161,15 @@ class ItemStatesView(APIView):
         item = self.core.item_manager.items.get(identifier)
 
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", 404)
+            return self.item_not_found(identifier)
 
+        content = await self.request.read()
         try:
-            content = (await self.request.content.read()).decode()
             commit = STATE_COMMIT_SCHEMA(
                 json.loads(content) if content else {})
         # pylint: disable=broad-except
         except Exception as e:
-            return JSONResponse(error=e)
+            return self.error(e, status_code=400)
 
         if not commit.keys() & item.states.states.keys() == commit.keys():
             return self.error(
@@ -191,13 +178,10 @@ class ItemStatesView(APIView):
                 f"accepted states {set(item.states.states.keys())}")
 
         if not item.status == ItemStatus.ONLINE:
-            return JSONResponse(
-                error=ItemNotOnlineError(
-                    f"The item {item.identifier} is not online"))
+            return self.error(ItemNotOnlineError(
+                f"The item {item.identifier} is not online"))
 
-        return JSONResponse(dict(ChainMap(
-            *[await item.states.set(state, value)
-              for state, value in commit.items()])))
+        return self.json(await item.states.bulk_set(commit))
 
 
 @needs_auth()
@@ -212,9 +196,7 @@ class ItemStateView(APIView):
         item = self.core.item_manager.items.get(identifier)
 
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", 404)
+            return self.item_not_found(identifier)
 
         if state_name not in item.states.states.keys():
             return self.error(
@@ -225,8 +207,8 @@ class ItemStateView(APIView):
             return self.error(ItemNotOnlineError(
                 f"The item {item.identifier} is not online"))
 
+        content = await self.request.read()
         try:
-            content = (await self.request.content.read()).decode()
             value = json.loads(content) if content else {}
             result = await item.states.set(state_name, value)
         # pylint: disable=broad-except
@@ -242,9 +224,7 @@ class ItemStateView(APIView):
         item = self.core.item_manager.items.get(identifier)
 
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", 404)
+            return self.item_not_found(identifier)
 
         if state_name not in item.states.states:
             return self.error(
@@ -272,9 +252,7 @@ class ActionsView(APIView):
         identifier = self.data["id"]
         item = self.core.item_manager.items.get(identifier)
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", status_code=404)
+            return self.item_not_found(identifier)
 
         return self.json(data=list(item.actions.keys()))
 
@@ -294,12 +272,10 @@ class ExecuteActionView(APIView):
         action_name = self.data["action_name"]
         item = self.core.item_manager.items.get(identifier)
         if not item:
-            return self.error(
-                ERROR_ITEM_NOT_FOUND,
-                f"No item found with identifier {identifier}", status_code=404)
+            return self.item_not_found(identifier)
 
+        content = await self.request.read()
         try:
-            content = (await self.request.content.read()).decode()
             kwargs = json.loads(content) if content else {}
         except json.JSONDecodeError as e:
             return self.error(e)
@@ -5,6 +5,7 @@ from typing import Callable, Optional
 
 import voluptuous as vol
 from aiohttp import web
+from multidict import CIMultiDict
 
 from homecontrol.dependencies.entity_types import ModuleDef
 
@@ -25,12 +26,14 @@ CONFIG_SCHEMA = vol.Schema({
 class Module(ModuleDef):
     """The API app module"""
     api_app: Optional[web.Application] = None
+    headers: CIMultiDict
 
     async def init(self):
         """Initialise the API app"""
         # Prohibit reloading of the configuration
         self.cfg = await self.core.cfg.register_domain(
             "api-server", schema=CONFIG_SCHEMA)
+        self.headers = CIMultiDict(self.cfg.get("headers", {}))
 
         @self.core.event_bus.register("http_add_main_subapps")
         async def add_subapp(event, main_app):
@@ -51,17 +54,15 @@ class Module(ModuleDef):
 
     def middlewares(self) -> list:
         """Return middlewares"""
-        middlewares = []
+        return [self.config_headers] if self.headers else []
 
-        @middlewares.append
-        @web.middleware
-        async def config_headers(
-                request: web.Request, handler: Callable) -> web.Response:
-            response = await handler(request)
-            response.headers.update(self.cfg.get("headers", {}))
-            return response
-
-        return middlewares
+    @web.middleware
+    async def config_headers(
+            self, request: web.Request, handler: Callable) -> web.Response:
+        """Adds the configured headers to every response"""
+        response = await handler(request)
+        response.headers.update(self.headers)
+        return response
 
     async def stop(self) -> None:
         """Stop the API app"""
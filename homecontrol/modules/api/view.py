@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any, Union
 
 from aiohttp import web
 
+from homecontrol.const import ERROR_ITEM_NOT_FOUND
 from homecontrol.dependencies.json_response import JSONResponse
 
 if TYPE_CHECKING:
@@ -28,12 +29,18 @@ class APIView(web.View):
         assert cls.path
         app.router.add_view(cls.path, cls)
 
+    @property
+    def pretty(self) -> bool:
+        """Whether the response should be human-readable (?pretty)"""
+        return "pretty" in self.request.query
+
     def json(
             self, data: Any = None, status_code: int = 200,
             headers: dict = None) -> JSONResponse:
         """Creates a JSONResponse"""
         return JSONResponse(
-            data, status_code=status_code, core=self.core, headers=headers)
+            data, status_code=status_code, core=self.core, headers=headers,
+            pretty=self.pretty)
 
     def error(
             self, error: Union[str, Exception],
@@ -46,5 +53,11 @@ class APIView(web.View):
             } if isinstance(error, Exception) else {
                 "type": error,
                 "message": message
-            }, status_code=status_code
+            }, status_code=status_code, core=self.core, pretty=self.pretty
         )
+
+    def item_not_found(self, identifier: str) -> JSONResponse:
+        """Creates the error response for an unknown item"""
+        return self.error(
+            ERROR_ITEM_NOT_FOUND,
+            f"No item found with identifier {identifier}", status_code=404)
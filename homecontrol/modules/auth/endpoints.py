@@ -41,6 +41,15 @@ AUTH_CODE_SCHEMA = TOKEN_PAYLOAD_SCHEMA.extend({
 REFRESH_TOKEN_SCHEMA = TOKEN_PAYLOAD_SCHEMA.extend({
     vol.Required("refresh_token"): str
 }, extra=vol.PREVENT_EXTRA)
+LONG_LIVED_TOKEN_SCHEMA = vol.Schema({
+    vol.Required("client_id"): str,
+    vol.Optional("client_name", default=None): vol.Any(str, None)
+})
+CREATE_USER_SCHEMA = vol.Schema({
+    vol.Required("name"): str,
+    vol.Required("password"): str,
+    vol.Optional("is_owner", default=False): bool,
+})
 
 
 def add_routes(app: web.Application):
@@ -79,13 +88,9 @@ class LongLivedTokenView(AuthView):
     async def post(self) -> JSONResponse:
         """POST /long_lived_token"""
         try:
-            data = vol.Schema({
-                vol.Required("client_id"): str,
-                vol.Optional(
-                    "client_name", default=None): vol.Any(str, None)
-            })(await self.request.json())
+            data = LONG_LIVED_TOKEN_SCHEMA(await self.request.json())
         except (vol.Invalid, JSONDecodeError) as e:
-            return self.error(e)
+            return self.error(e, status_code=400)
 
         refresh_token = await self.auth_manager.create_refresh_token(
             client_id=data["client_id"],
@@ -96,7 +101,7 @@ class LongLivedTokenView(AuthView):
         access_token = await self.auth_manager.create_access_token(
             refresh_token)
 
-        return JSONResponse({
+        return self.json({
             "access_token": access_token.token,
             "token_type": "bearer",
             "expires_in": access_token.expiration,
@@ -178,10 +183,12 @@ class BindCredentialsView(AuthView):
                 vol.Optional("data", default=None): object
             })(await self.request.json())
         except (vol.Invalid, JSONDecodeError) as e:
-            return JSONResponse(error=str(e))
+            return self.error(e, status_code=400)
 
         if data["user"] and not self.request["user"].owner:
-            return JSONResponse(error="Unauthorized", status_code=401)
+            return self.error(
+                "unauthorized", "Only owners can bind credentials for "
+                "other users", status_code=401)
 
         user = self.auth_manager.get_user(data["user"]) or self.request["user"]
 
@@ -192,7 +199,7 @@ class BindCredentialsView(AuthView):
             user, data["data"])
         self.auth_manager.users.schedule_save()
 
-        return JSONResponse({
+        return self.json({
             "credential_id": creds.credential_id,
             "data": return_data
         })
@@ -205,12 +212,10 @@ class CreateUserView(AuthView):
 
     async def post(self) -> JSONResponse:
         """POST /create_user"""
-        payload_schema = vol.Schema({
-            vol.Required("name"): str,
-            vol.Required("password"): str,
-            vol.Optional("is_owner", default=False): bool,
-        })
-        payload = payload_schema(await self.request.json())
+        try:
+            payload = CREATE_USER_SCHEMA(await self.request.json())
+        except (vol.Invalid, JSONDecodeError) as e:
+            return self.error(e, status_code=400)
 
         user = await self.auth_manager.create_user(
             name=payload["name"],
@@ -292,7 +297,7 @@ class TokenView(AuthView):
             login_valid = await cred_provider.validate_login_data(
                 user,
                 payload["password"]
-            ) if user else False
+            )
 
             if not login_valid:
                 return self.json({
@@ -341,7 +346,7 @@ class TokenView(AuthView):
         access_token = await self.auth_manager.create_access_token(
             refresh_token)
 
-        return JSONResponse({
+        return self.json({
             "access_token": access_token.token,
             "token_type": "bearer",
             "expires_in": access_token.expiration,
@@ -163,16 +163,17 @@ class Chromecast(MediaPlayer):
         """Action: Quit casting"""
         self._chromecast.quit_app()
 
+    # The listener methods are called from pychromecast's socket thread
     def new_media_status(self, status) -> None:
         """Handle new media status"""
-        self.core.loop.run_in_executor(None, self.update_media_status, status)
+        self.core.loop.call_soon_threadsafe(self.update_media_status, status)
 
     def new_connection_status(self, status) -> None:
         """Handles connection status updates"""
-        if status.status == 'CONNECTED':
-            self.update_status(ItemStatus.ONLINE)
-        else:
-            self.update_status(ItemStatus.OFFLINE)
+        self.core.loop.call_soon_threadsafe(
+            self.update_status,
+            ItemStatus.ONLINE if status.status == 'CONNECTED'
+            else ItemStatus.OFFLINE)
 
     def update_media_status(self, status) -> None:
         """Update media status"""
@@ -192,5 +193,7 @@ class Chromecast(MediaPlayer):
     async def stop(self) -> None:
         if not self._chromecast:
             return
+        # disconnect joins pychromecast's socket thread
         with suppress(Exception):
-            self._chromecast.disconnect(1)
+            await self.core.loop.run_in_executor(
+                None, self._chromecast.disconnect, 1)
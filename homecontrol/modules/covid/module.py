@@ -30,7 +30,7 @@ class CovidStats(Item):
     async def init(self):
         """Initialise the item"""
         self.update_task = self.core.loop.create_task(self.update_interval())
-        self.session = aiohttp.ClientSession(loop=self.core.loop)
+        self.session = aiohttp.ClientSession()
 
     async def update_interval(self) -> None:
         """Updates the states"""
@@ -41,11 +41,7 @@ class ESPHomeItem(Item):
         item.name = name
         item.module = core.modules.esphome
 
-        item.actions = {}
-        for attribute in dir(item):
-            func = getattr(item, attribute)
-            if hasattr(func, "action_name"):
-                item.actions[getattr(func, "action_name")] = func
+        item.bind_actions()
         item.states = StateProxy(item, core)
 
         return item
@@ -1,6 +1,5 @@
 """The Frontend module"""
 
-import json
 import logging
 import os
 from typing import TYPE_CHECKING, Iterator, List, Optional, cast
@@ -12,6 +11,7 @@ from homecontrol_frontend import RESOURCE_PATH
 from yarl import URL
 
 from homecontrol.const import EVENT_CORE_BOOTSTRAP_COMPLETE
+from homecontrol.dependencies import json
 from homecontrol.dependencies.entity_types import Module as ModuleType
 from homecontrol.modules.api.view import APIView
 
@@ -145,10 +145,11 @@ class ManifestView(APIView):
     async def get(self) -> web.Response:
         """GET /manifest.webmanifest"""
         module = cast(Module, self.core.modules.frontend)
-        manifest = json.load(
-            open(module.resource_path.rstrip("/") + self.path))
+        with open(module.resource_path.rstrip("/") + self.path,
+                  "rb") as manifest_file:
+            manifest = json.loads(manifest_file.read())
 
-        data = json.dumps({
+        data = json.dumps_bytes({
             **manifest,
             "name": "HomeControl",
             "short_name": "HomeControl",
@@ -159,7 +160,7 @@ class ManifestView(APIView):
             "lang": "en-US"
         }, sort_keys=True)
         return web.Response(
-            text=data, content_type="application/manifest+json")
+            body=data, content_type="application/manifest+json")
 
 
 class PanelsView(APIView):
@@ -1,21 +1,38 @@
 """Provides integration with iCloud devices"""
 import asyncio
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Dict, cast
 
 import voluptuous as vol
 from pyicloud import PyiCloudService
-from pyicloud.services.findmyiphone import AppleDevice
+from pyicloud.services.findmyiphone import (AppleDevice,
+                                           FindMyiPhoneServiceManager)
 
 from homecontrol.const import ItemStatus
 from homecontrol.dependencies.action_decorator import action
-from homecontrol.dependencies.entity_types import Item
+from homecontrol.dependencies.entity_types import Item, ModuleDef
 from homecontrol.dependencies.state_proxy import StateDef, StateProxy
 from homecontrol.modules.location.module import Location
 
 if TYPE_CHECKING:
     from homecontrol.core import Core
 
+LOGGER = logging.getLogger(__name__)
+
+
+class Module(ModuleDef):
+    """Runs the blocking iCloud calls on a thread pool of its own"""
+    executor: ThreadPoolExecutor
+
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="icloud")
+
+    async def stop(self) -> None:
+        self.executor.shutdown(wait=False)
+
 
 class ICloudDeviceLocation(Location):
     """Stores the location of an iCloud device"""
@@ -34,11 +51,7 @@ class ICloudDeviceLocation(Location):
         item.name = device.name
         item.module = core.modules.icloud
 
-        item.actions = {}
-        for attribute in dir(item):
-            func = getattr(item, attribute)
-            if hasattr(func, "action_name"):
-                item.actions[getattr(func, "action_name")] = func
+        item.bind_actions()
         item.states = StateProxy(item, core)
 
         return item
@@ -60,37 +73,32 @@ class ICloudDevice(Item):
     location_item: "ICloudDeviceLocation"
     device: AppleDevice
     device_id: str
-    update_task: asyncio.Task
 
     battery_level = StateDef()
 
     async def init(self) -> None:
-        self.update_task = self.core.loop.create_task(self._update_interval())
         self.location_item = await ICloudDeviceLocation.constructor(
             self.core, self)
         await self.core.item_manager.register_item(self.location_item)
 
-    async def _update_interval(self) -> None:
-        while True:
-            await self.update_states()
-            await asyncio.sleep(30)
+    def update_callback(self, content: Dict[str, Any]) -> None:
+        """Receives the device data fetched by the account"""
+        self.states.bulk_update(
+            battery_level=round((content.get("batteryLevel") or 0) * 100))
+        location = content.get("location")
+        if location:
+            self.location_item.location_callback(location)
 
     @action("update")
     async def update_states(self) -> None:
         """Updates the states"""
-        def _update() -> None:
-            status = self.device.status()
-            location = self.device.location()
-            self.states.bulk_update(
-                battery_level=round(status.get("batteryLevel", 0) * 100))
-            self.location_item.location_callback(location)
-
-        await self.core.loop.run_in_executor(None, _update)
+        await self.account.update_devices()
 
     @action("play_sound")
     async def play_sound(self) -> None:
         """Plays a sound on the device"""
-        await self.core.loop.run_in_executor(None, self.device.play_sound)
+        await self.core.loop.run_in_executor(
+            self.account.executor, self.device.play_sound)
 
     # pylint: disable=arguments-differ
     @classmethod
@@ -105,11 +113,7 @@ class ICloudDevice(Item):
         item.name = name
         item.core = core
 
-        item.actions = {}
-        for attribute in dir(item):
-            func = getattr(item, attribute)
-            if hasattr(func, "action_name"):
-                item.actions[getattr(func, "action_name")] = func
+        item.bind_actions()
 
         item.states = StateProxy(item, core)
 
@@ -119,9 +123,6 @@ class ICloudDevice(Item):
 
         return item
 
-    async def stop(self) -> None:
-        self.update_task.cancel()
-
 
 class ICloudAccount(Item):
     """An iCloud account"""
@@ -130,7 +131,10 @@ class ICloudAccount(Item):
         vol.Optional("password"): str
     }, extra=vol.ALLOW_EXTRA)
     api: PyiCloudService
-    entities: Dict[int, ICloudDevice]
+    executor: ThreadPoolExecutor
+    devices: FindMyiPhoneServiceManager
+    entities: Dict[str, ICloudDevice]
+    update_task: asyncio.Task
 
     @classmethod
     async def constructor(
@@ -146,6 +150,7 @@ class ICloudAccount(Item):
         item.unique_identifier = unique_identifier
         item.name = name
         item.cfg = cfg
+        item.executor = cast(Module, core.modules.icloud).executor
 
         item.actions = {}
 
@@ -153,12 +158,15 @@ class ICloudAccount(Item):
         item.status = ItemStatus.OFFLINE
 
         api = await core.loop.run_in_executor(
-            None, PyiCloudService, cfg["username"], cfg.get("password"),
+            item.executor, PyiCloudService,
+            cfg["username"], cfg.get("password"),
             os.path.join(core.cfg_dir, ".storage/icloud")
         )
         item.api = api
 
-        devices = await core.loop.run_in_executor(None, lambda: api.devices)
+        devices = await core.loop.run_in_executor(
+            item.executor, lambda: api.devices)
+        item.devices = devices
 
         for device_id, device in devices.items():
             normalized_name = str(device).lower().replace(
@@ -179,3 +187,33 @@ class ICloudAccount(Item):
             await core.item_manager.register_item(entity_item)
 
         return item
+
+    async def init(self) -> None:
+        self.update_task = self.core.loop.create_task(self._update_interval())
+
+    async def _update_interval(self) -> None:
+        while True:
+            # One failed update must not stop polling the account's devices
+            try:
+                await self.update_devices()
+            # pylint: disable=broad-except
+            except Exception:
+                LOGGER.exception("Updating the iCloud devices failed")
+            await asyncio.sleep(30)
+
+    async def update_devices(self) -> None:
+        """Fetches all devices with a single request and updates them"""
+        def _refresh() -> Dict[str, Dict[str, Any]]:
+            self.devices.refresh_client()
+            return {device_id: device.content
+                    for device_id, device in self.devices.items()}
+
+        contents = await self.core.loop.run_in_executor(
+            self.executor, _refresh)
+        for device_id, content in contents.items():
+            entity = self.entities.get(device_id)
+            if entity:
+                entity.update_callback(content)
+
+    async def stop(self) -> None:
+        self.update_task.cancel()
@@ -96,7 +96,7 @@ class MetnoWeather(Item):
         }
 
     async def init(self) -> Optional[bool]:
-        self.client_session = ClientSession(loop=self.core.loop)
+        self.client_session = ClientSession()
         self.location = self.get_location()
 
         if not self.location:
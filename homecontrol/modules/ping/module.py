@@ -75,6 +75,7 @@ class PingSensor(Item):
                 self.states.update("online", False)
                 LOGGER.error("Ping command returned an error: %s, '%s': %s",
                              ping_process.returncode, self.command, err)
+                return
 
             match = PING_PATTERN.search(str(out).split("\n")[-1])
             self.states.bulk_update(
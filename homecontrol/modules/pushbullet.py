@@ -1,10 +1,10 @@
 """Pushbullet module"""
-import json
 import logging
 
 import aiohttp
 
 import voluptuous as vol
+from homecontrol.dependencies import json
 from homecontrol.dependencies.action_decorator import action
 from homecontrol.dependencies.entity_types import Item
 
@@ -31,13 +31,23 @@ class Pushbullet(Item):
     config_schema = vol.Schema({
         vol.Required("access_token"): str
     }, extra=vol.ALLOW_EXTRA)
+    session: aiohttp.ClientSession
+
+    async def init(self) -> None:
+        """Creates the HTTP session that is used for every push"""
+        self.session = aiohttp.ClientSession(headers={
+            "Access-Token": self.cfg["access_token"],
+            "Content-Type": "application/json"
+        })
 
     @action("send_message")
     async def send_message(self, **data):
         """Sends a message"""
-        data = json.dumps(MESSAGE_SCHEMA(data))
-        async with aiohttp.ClientSession(loop=self.core.loop) as session:
-            await session.post(PUSH_URL, data=data, headers={
-                "Access-Token": self.cfg["access_token"],
-                "Content-Type": "application/json"
-            })
+        data = json.dumps_bytes(MESSAGE_SCHEMA(data))
+        async with self.session.post(PUSH_URL, data=data) as response:
+            if response.status != 200:
+                LOGGER.warning("Pushbullet responded with status %s",
+                               response.status)
+
+    async def stop(self) -> None:
+        await self.session.close()
@@ -50,7 +50,8 @@ class SystemMonitor(Item):
 
     async def update(self) -> None:
         """Update the CPU and memory stats every 2 seconds"""
-        def _update():
+        while True:
+            # These calls only read from /proc and don't block
             memory = psutil.virtual_memory()
             swap = psutil.swap_memory()
 
@@ -61,6 +62,4 @@ class SystemMonitor(Item):
                 swap_usage=swap.used,
                 swap_percent=swap.percent
             )
-        while True:
-            await self.core.loop.run_in_executor(None, _update)
             await asyncio.sleep(2)
@@ -35,7 +35,7 @@ class WebSocketCommand:
         raise NotImplementedError()
 
     def _close(self, task: asyncio.Task):
-        asyncio.run_coroutine_threadsafe(self.close(), loop=self.core.loop)
+        self.core.create_task(self.close())
 
     async def close(self):
         """Triggered when websocket is closing"""
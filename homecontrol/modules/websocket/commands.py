@@ -1,15 +1,13 @@
 """WebSocket commands"""
 # pylint: disable=relative-beyond-top-level
-from collections import ChainMap
+import asyncio
 from typing import TYPE_CHECKING, Any, Dict, Union, cast
 
 import voluptuous as vol
 
 from homecontrol.const import (ERROR_INVALID_ITEM_STATES, ERROR_ITEM_NOT_FOUND,
-                               EVENT_ITEM_STATUS_CHANGED,
                                ITEM_ACTION_NOT_FOUND)
-from homecontrol.dependencies.entity_types import Item, ItemStatus
-from homecontrol.dependencies.event_bus import Event
+from homecontrol.dependencies.entity_types import ItemStatus
 from homecontrol.modules.auth.decorator import needs_auth
 from homecontrol.modules.auth.module import Module as AuthModule
 
@@ -51,27 +49,9 @@ class WatchStatesCommand(WebSocketCommand):
 
     async def handle(self) -> Union[str, Dict[Any, Any]]:
         """Handle the watch_states command"""
-        if self.command not in self.session.subscriptions:
-            self.core.event_bus.register(
-                "state_change")(self.on_state_change)
-
-        self.session.subscriptions.add(self.command)
+        self.session.module.subscribe(self.session, self.command)
         return self.success("Now listening to state changes")
 
-    async def on_state_change(
-            self, event: Event, item: Item, changes: dict) -> None:
-        """Handle the state_change event"""
-        self.send_message({
-            "event": "state_change",
-            "item": item.unique_identifier,
-            "changes": changes
-        })
-
-    async def close(self) -> None:
-        """Remove the event listener"""
-        self.core.event_bus.remove_handler(
-            "state_change", self.on_state_change)
-
 
 @needs_auth()
 class WatchStatusCommand(WebSocketCommand):
@@ -80,28 +60,9 @@ class WatchStatusCommand(WebSocketCommand):
 
     async def handle(self) -> Union[str, Dict[Any, Any]]:
         """Handle the watch_status command"""
-        if self.command not in self.session.subscriptions:
-            self.core.event_bus.register(
-                EVENT_ITEM_STATUS_CHANGED)(self.on_status_change)
-
-        self.session.subscriptions.add(self.command)
+        self.session.module.subscribe(self.session, self.command)
         return self.success("Now listening to status changes")
 
-    async def on_status_change(
-            self, event: Event, item: Item, previous: ItemStatus) -> None:
-        """Handle the status_change event"""
-        self.send_message({
-            "event": "status_change",
-            "item": item.unique_identifier,
-            "previous": previous.value,
-            "status": item.status.value
-        })
-
-    async def close(self) -> None:
-        """Remove the event listener"""
-        self.core.event_bus.remove_handler(
-            EVENT_ITEM_STATUS_CHANGED, self.on_status_change)
-
 
 class AuthCommand(WebSocketCommand):
     """Auth command"""
@@ -147,19 +108,17 @@ class GetItemsCommand(WebSocketCommand):
 
     async def handle(self) -> Union[str, Dict[Any, Any]]:
         """Handle the get_items command"""
+        items = list(self.core.item_manager.items.values())
+        # Getters might do I/O, dump all items concurrently
+        states = await asyncio.gather(*(
+            item.states.dump() for item in items))
         return self.success([
             {
-                "identifier": item.identifier,
-                "unique_identifier": item.unique_identifier,
-                "name": item.name,
-                "type": item.type,
-                "module": item.module.name,
+                **item.static_info,
                 "status": item.status.value,
-                "actions": list(item.actions.keys()),
-                "states": await item.states.dump(),
-                "implements": item.implements,
+                "states": item_states,
                 "metadata": item.metadata
-            } for item in self.core.item_manager.items.values()
+            } for item, item_states in zip(items, states)
         ])
 
 
@@ -244,11 +203,11 @@ class SetStatesCommand(WebSocketCommand):
                 ERROR_ITEM_NOT_FOUND,
                 f"No item found with identifier {identifier}")
 
-        if changes.keys() - item.states.states.keys():
+        unknown_states = changes.keys() - item.states.states.keys()
+        if unknown_states:
             return self.error(
                 ERROR_INVALID_ITEM_STATES,
-                f"States {changes.keys() - item.states.states.keys()}"
-                "don't exist on item {item.name}"
+                f"States {unknown_states} don't exist on item {item.name}"
             )
 
         if item.status != ItemStatus.ONLINE:
@@ -258,9 +217,7 @@ class SetStatesCommand(WebSocketCommand):
             )
 
         try:
-            result = dict(ChainMap(
-                *[await item.states.set(state, value)
-                  for state, value in changes.items()]))
+            result = await item.states.bulk_set(changes)
             return self.success({
                 "result": result
             })
@@ -276,7 +233,9 @@ class CoreShutdownCommand(WebSocketCommand):
 
     async def handle(self) -> Union[str, Dict[Any, Any]]:
         """Handle the shutdown command"""
-        self.core.loop.call_soon(self.core.shutdown)
+        # The reply is queued before Core.stop runs
+        # and sent before the session is closed
+        self.core.shutdown()
         return self.success("Shutting down")
 
 
@@ -287,7 +246,9 @@ class CoreRestartCommand(WebSocketCommand):
 
     async def handle(self) -> Union[str, Dict[Any, Any]]:
         """Handle the restart command"""
-        self.core.loop.call_soon(self.core.restart)
+        # The reply is queued before Core.stop runs
+        # and sent before the session is closed
+        self.core.restart()
         return self.success("Restarting")
 
 
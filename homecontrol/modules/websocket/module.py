@@ -3,13 +3,18 @@
 import asyncio
 # pylint: disable=relative-beyond-top-level
 import logging
-from typing import TYPE_CHECKING, Optional, Union, cast
+import weakref
+from contextlib import suppress
+from typing import (TYPE_CHECKING, Callable, Dict, Optional, Tuple, Union,
+                    cast)
 
 import voluptuous as vol
 from aiohttp import web
 
-from homecontrol.const import MAX_PENDING_WS_MSGS
-from homecontrol.dependencies.entity_types import ModuleDef
+from homecontrol.const import EVENT_ITEM_STATUS_CHANGED, MAX_PENDING_WS_MSGS
+from homecontrol.dependencies import json
+from homecontrol.dependencies.entity_types import Item, ItemStatus, ModuleDef
+from homecontrol.dependencies.event_bus import Event
 
 from .commands import WebSocketCommand, add_commands
 from .message import WebSocketMessage
@@ -36,13 +41,49 @@ EVENT_MESSAGE_SCHEMA = MESSAGE_SCHEMA.extend({"event": str})
 RESPONSE_MESSAGE_SCHEMA = MESSAGE_SCHEMA.extend({"success": bool})
 
 
+def encode_message(message: dict, core: "Core") -> str:
+    """Encodes a message for a text frame"""
+    return json.dumps_bytes(message, core=core).decode()
+
+
+class PendingStateChange:
+    """
+    A queued state_change message
+    Later changes of the same item are merged into it until it is sent
+    """
+    __slots__ = ("item", "message", "payload")
+
+    def __init__(self, item: str, message: dict, payload: str) -> None:
+        self.item = item
+        self.message = message
+        self.payload: Optional[str] = payload
+
+    def merge(self, changes: dict) -> None:
+        """Merges newer changes, the shared message is copied first"""
+        if self.payload is not None:
+            self.message = {
+                **self.message, "changes": dict(self.message["changes"])}
+            self.payload = None
+        self.message["changes"].update(changes)
+
+
 class Module(ModuleDef):
     """The WebSocket API"""
 
     async def init(self) -> None:
         """Initialise the WebSocket module"""
-        self.sessions = set()
+        # Connected sessions are kept alive by their connection handler
+        self.sessions: "weakref.WeakSet[WebSocketSession]" = weakref.WeakSet()
         self.command_handlers = {}
+        # The event handlers are only registered while a session subscribes
+        self.subscription_handlers: Dict[str, Tuple[str, Callable]] = {
+            "watch_states": ("state_change", self.on_state_change),
+            "watch_status": (EVENT_ITEM_STATUS_CHANGED, self.on_status_change)
+        }
+        self.subscribers: Dict[str, "weakref.WeakSet[WebSocketSession]"] = {
+            subscription: weakref.WeakSet()
+            for subscription in self.subscription_handlers
+        }
         self.core.event_bus.register(
             "http_add_api_routes")(self._add_api_route)
         self.core.event_bus.broadcast(
@@ -75,8 +116,80 @@ class Module(ModuleDef):
         handler.schema = schema
         self.command_handlers[handler.command] = handler
 
+    def subscribe(
+            self, session: "WebSocketSession", subscription: str) -> None:
+        """Subscribes a session to a broadcast"""
+        if subscription in session.subscriptions:
+            return
+        sessions = self.subscribers[subscription]
+        if not sessions:
+            event, handler = self.subscription_handlers[subscription]
+            self.core.event_bus.register(event)(handler)
+        sessions.add(session)
+        session.subscriptions.add(subscription)
+
+    def unsubscribe(self, session: "WebSocketSession") -> None:
+        """Removes all subscriptions of a session"""
+        for subscription in session.subscriptions:
+            sessions = self.subscribers[subscription]
+            sessions.discard(session)
+            if not sessions:
+                event, handler = self.subscription_handlers[subscription]
+                self.core.event_bus.remove_handler(event, handler)
+        session.subscriptions.clear()
+
+    def broadcast(self, subscription: str, message: dict) -> None:
+        """
+        Sends a message to every session with a subscription
+        The message is only encoded once
+        """
+        sessions = self.subscribers.get(subscription)
+        if not sessions:
+            return
+
+        try:
+            payload = encode_message(message, self.core)
+        except (TypeError, ValueError):
+            LOGGER.warning("Couldn't encode message: %s", message)
+            return
+        for session in list(sessions):
+            session.send_message(payload)
+
+    async def on_state_change(
+            self, event: Event, item: Item, changes: dict) -> None:
+        """Handle the state_change event"""
+        sessions = self.subscribers["watch_states"]
+        if not sessions:
+            return
+
+        message = {
+            "event": "state_change",
+            "item": item.unique_identifier,
+            "changes": changes
+        }
+        try:
+            payload = encode_message(message, self.core)
+        except (TypeError, ValueError):
+            LOGGER.warning("Couldn't encode message: %s", message)
+            return
+        for session in list(sessions):
+            session.send_state_change(
+                item.unique_identifier, message, payload)
+
+    async def on_status_change(
+            self, event: Event, item: Item, previous: ItemStatus) -> None:
+        """Handle the status_change event"""
+        self.broadcast("watch_status", {
+            "event": "status_change",
+            "item": item.unique_identifier,
+            "previous": previous.value,
+            "status": item.status.value
+        })
+
     async def stop(self) -> None:
-        close_tasks = [session.close() for session in self.sessions]
+        close_tasks = [
+            self.core.loop.create_task(session.close(flush=True))
+            for session in list(self.sessions)]
         if not close_tasks:
             return
         await asyncio.wait(close_tasks, timeout=2)
@@ -102,18 +215,24 @@ class WebSocketSession:
         self.user = self.request["user"] or None
         self.writing_queue = asyncio.Queue(maxsize=MAX_PENDING_WS_MSGS)
         self.subscriptions = set()
+        self.pending_states: Dict[str, PendingStateChange] = {}
 
     async def writer(self):
         """Write the messages from the queue"""
         while not self.websocket.closed:
-            message: Union[str, dict] = await self.writing_queue.get()
+            message: Union[str, dict, PendingStateChange] = (
+                await self.writing_queue.get())
+            if isinstance(message, PendingStateChange):
+                del self.pending_states[message.item]
+                message = message.payload or message.message
             try:
-                if isinstance(message, str):
-                    await self.websocket.send_str(message)
-                else:
-                    await self.websocket.send_json(message)
+                if not isinstance(message, str):
+                    message = encode_message(message, self.core)
+                await self.websocket.send_str(message)
             except (TypeError, ValueError):
                 LOGGER.warning("Couldn't encode message: %s", message)
+            finally:
+                self.writing_queue.task_done()
 
     def dispatch_message(self, message: WebSocketMessage) -> None:
         """Dispatches an incoming WS message"""
@@ -147,13 +266,18 @@ class WebSocketSession:
         except vol.Invalid as e:
             return self.send_message(
                 message.error("invalid_parameters", e.error_message))
-        asyncio.run_coroutine_threadsafe(
-            _dispatch_message(
-                handler(message, self.core, self, data)),
-            loop=self.core.loop)
+        self.core.create_task(
+            _dispatch_message(handler(message, self.core, self, data)))
 
-    async def close(self):
-        """Closes the connection"""
+    async def close(self, flush: bool = False):
+        """
+        Closes the connection
+        With flush the queued messages are sent first,
+        e.g. the reply to core_shutdown
+        """
+        if flush and not self.websocket.closed:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.writing_queue.join(), timeout=1)
         self.writer_task.cancel()
         self.handler_task.cancel()
         await self.websocket.close()
@@ -172,25 +296,30 @@ class WebSocketSession:
                     LOGGER.debug("Non-text data received")
                     break
                 try:
-                    data = MESSAGE_SCHEMA(message.json())
-                    self.dispatch_message(WebSocketMessage(data))
+                    data = json.loads(message.data)
                 except ValueError:
                     LOGGER.debug("Invalid JSON received")
                     break
-                except vol.Invalid:
+                # The full validation happens with the command's schema
+                if (not isinstance(data, dict)
+                        or not isinstance(data.get("type"), str)):
                     LOGGER.debug("Message doesn't match the schema")
                     break
+                self.dispatch_message(WebSocketMessage(data))
         except asyncio.CancelledError:
             LOGGER.info("Connection closed by client")
         except Exception:  # pylint: disable=broad-except
             LOGGER.exception("Unexpected error")
         finally:
             LOGGER.debug("Disconnected from %s", self.request.host)
+            self.module.sessions.discard(self)
+            self.module.unsubscribe(self)
             await self.close()
 
         return self.websocket
 
-    def send_message(self, message: Union[str, dict]) -> None:
+    def send_message(
+            self, message: Union[str, dict, PendingStateChange]) -> None:
         """
         Sends a message
         message must be either of type str or JSON serialisable
@@ -199,3 +328,18 @@ class WebSocketSession:
             self.writing_queue.put_nowait(message)
         except asyncio.QueueFull:
             self.core.loop.create_task(self.close())
+
+    def send_state_change(
+            self, item: str, message: dict, payload: str) -> None:
+        """
+        Sends a state_change message
+        If the client is too slow and a state_change for the same item
+        is still queued, the changes are merged into that one instead
+        """
+        pending = self.pending_states.get(item)
+        if pending:
+            pending.merge(message["changes"])
+            return
+        pending = PendingStateChange(item, message, payload)
+        self.pending_states[item] = pending
+        self.send_message(pending)
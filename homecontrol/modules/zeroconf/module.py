@@ -83,4 +83,5 @@ class Module(ModuleDef):
 
     async def stop(self) -> None:
         """Stop the zeroconf module"""
-        self.zeroconf.close()
+        # close joins the zeroconf threads
+        await self.core.loop.run_in_executor(None, self.zeroconf.close)